@@ -9,11 +9,23 @@ Usage example:
 from __future__ import annotations
 
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 from PIL import Image
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional accelerator.
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - Numba is an optional accelerator.
+    njit = None
+
 
 def parse_layers(value: str) -> list[Path]:
     layers = [layer.strip() for layer in value.split(",") if layer.strip()]
@@ -22,23 +34,184 @@ def parse_layers(value: str) -> list[Path]:
     return [Path(layer) for layer in layers]
 
 
+@functools.lru_cache(maxsize=128)
+def _load_rgba(path_str: str, mtime_ns: int, size: int) -> Image.Image:
+    # mtime_ns and size key the cache so edited files are re-decoded.
+    img = Image.open(path_str)
+    img.load()
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return img
+
+
+def _open_rgba(path: Path) -> Image.Image:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Layer not found: {path}") from None
+    # Copy so callers can mutate without corrupting the cached decode.
+    return _load_rgba(str(path), stat.st_mtime_ns, stat.st_size).copy()
+
+
 def load_layers(layer_paths: Iterable[Path]) -> list[Image.Image]:
-    images: list[Image.Image] = []
-    for path in layer_paths:
-        if not path.exists():
-            raise FileNotFoundError(f"Layer not found: {path}")
-        images.append(Image.open(path).convert("RGBA"))
-    return images
+    paths = list(layer_paths)
+    if len(paths) <= 1:
+        return [_open_rgba(path) for path in paths]
+    # libpng releases the GIL during decode, so layers decompress in parallel.
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        return list(executor.map(_open_rgba, paths))
+
+
+# Reusable RGBA canvases keyed by size, so repeated combine runs with the
+# same output dimensions skip a fresh full-image allocation per call. Only
+# canvases handed out by _acquire carry the pool marker; _release ignores
+# everything else, so images built by the NumPy paths are not retained.
+_CANVAS_POOL: dict[tuple[int, int], list[Image.Image]] = {}
+_CANVAS_POOL_MAX_PER_SIZE = 4
+_POOL_MARKER = "_pegasus_pool_canvas"
+
+
+def _acquire(size: tuple[int, int]) -> Image.Image:
+    pooled = _CANVAS_POOL.get(size)
+    if pooled:
+        canvas = pooled.pop()
+        canvas.paste((0, 0, 0, 0), (0, 0, *size))
+    else:
+        canvas = Image.new("RGBA", size)
+        setattr(canvas, _POOL_MARKER, True)
+    return canvas
+
+
+def _release(image: Image.Image) -> None:
+    if not getattr(image, _POOL_MARKER, False):
+        return
+    pooled = _CANVAS_POOL.setdefault(image.size, [])
+    if len(pooled) < _CANVAS_POOL_MAX_PER_SIZE:
+        pooled.append(image)
+
+
+def _validate_layers(layers: list[Image.Image]) -> None:
+    size = layers[0].size
+    for layer in layers:
+        if layer.mode != "RGBA":
+            raise ValueError(f"Layer must be RGBA, got {layer.mode}.")
+        if layer.size != size:
+            raise ValueError(f"Layer size {layer.size} does not match base size {size}.")
+
+
+def _composite_pillow(layers: list[Image.Image]) -> Image.Image:
+    # One pooled destination; each composite runs in Pillow's C blender.
+    dst = _acquire(layers[0].size)
+    dst.paste(layers[0])
+    for layer in layers[1:]:
+        dst.alpha_composite(layer)
+    return dst
+
+
+def _div255(x: "np.ndarray") -> "np.ndarray":
+    # round(x / 255) without leaving uint16: (x + 128 + ((x + 128) >> 8)) >> 8.
+    # Mutates x in place; callers only pass freshly computed products.
+    x += 128
+    return (x + (x >> 8)) >> 8
+
+
+def _composite_numpy(layers: list[Image.Image]) -> Image.Image:
+    # Fold layers bottom-up with the Porter-Duff "over" operator in
+    # premultiplied uint16 fixed point: half the memory traffic of float32
+    # and twice the SIMD lanes per instruction, with no divides until the
+    # final unpremultiply.
+    base = np.asarray(layers[0], dtype=np.uint16)
+    acc_alpha = base[..., 3:]
+    acc_rgb = _div255(base[..., :3] * acc_alpha)
+
+    for layer in layers[1:]:
+        arr = np.asarray(layer, dtype=np.uint16)
+        alpha = arr[..., 3:]
+        inv = 255 - alpha
+        acc_rgb = _div255(alpha * arr[..., :3]) + _div255(inv * acc_rgb)
+        acc_alpha = alpha + _div255(inv * acc_alpha)
+
+    divisor = np.maximum(acc_alpha, 1)
+    out_rgb = (acc_rgb * 255 + (divisor >> 1)) // divisor
+
+    combined = np.empty((*acc_alpha.shape[:2], 4), dtype=np.uint8)
+    combined[..., :3] = out_rgb
+    combined[..., 3:] = acc_alpha
+    return Image.fromarray(combined, "RGBA")
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _composite_stack_kernel(stack):  # pragma: no cover - compiled
+        # Fused fold over all layers: each pixel's running premultiplied
+        # RGBA stays in registers instead of N vectorized temporaries.
+        n, height, width, _ = stack.shape
+        out = np.empty((height, width, 4), dtype=np.uint8)
+        for y in prange(height):
+            for x in range(width):
+                alpha = int(stack[0, y, x, 3])
+                t = int(stack[0, y, x, 0]) * alpha + 128
+                red = (t + (t >> 8)) >> 8
+                t = int(stack[0, y, x, 1]) * alpha + 128
+                green = (t + (t >> 8)) >> 8
+                t = int(stack[0, y, x, 2]) * alpha + 128
+                blue = (t + (t >> 8)) >> 8
+                for i in range(1, n):
+                    fg_a = int(stack[i, y, x, 3])
+                    inv = 255 - fg_a
+                    t = int(stack[i, y, x, 0]) * fg_a + 128
+                    u = inv * red + 128
+                    red = ((t + (t >> 8)) >> 8) + ((u + (u >> 8)) >> 8)
+                    t = int(stack[i, y, x, 1]) * fg_a + 128
+                    u = inv * green + 128
+                    green = ((t + (t >> 8)) >> 8) + ((u + (u >> 8)) >> 8)
+                    t = int(stack[i, y, x, 2]) * fg_a + 128
+                    u = inv * blue + 128
+                    blue = ((t + (t >> 8)) >> 8) + ((u + (u >> 8)) >> 8)
+                    u = inv * alpha + 128
+                    alpha = fg_a + ((u + (u >> 8)) >> 8)
+                divisor = alpha if alpha > 0 else 1
+                out[y, x, 0] = (red * 255 + (divisor >> 1)) // divisor
+                out[y, x, 1] = (green * 255 + (divisor >> 1)) // divisor
+                out[y, x, 2] = (blue * 255 + (divisor >> 1)) // divisor
+                out[y, x, 3] = alpha
+        return out
+
+else:
+    _composite_stack_kernel = None
+
+
+def _composite_numba(layers: list[Image.Image]) -> Image.Image:
+    stack = np.stack([np.asarray(layer, dtype=np.uint8) for layer in layers])
+    return Image.fromarray(_composite_stack_kernel(stack), "RGBA")
+
+
+def _composite_opaque(layers: list[Image.Image]) -> Image.Image:
+    # With an opaque base the output alpha is always 255, so the premultiply,
+    # unpremultiply, and alpha accumulation all drop out: each overlay is a
+    # straight integer lerp against the running RGB.
+    rgb = np.asarray(layers[0].convert("RGB"), dtype=np.uint16)
+    for layer in layers[1:]:
+        arr = np.asarray(layer, dtype=np.uint16)
+        alpha = arr[..., 3:]
+        rgb = _div255(alpha * arr[..., :3] + (255 - alpha) * rgb)
+    return Image.fromarray(rgb.astype(np.uint8), "RGB")
 
 
 def combine_layers(layers: list[Image.Image]) -> Image.Image:
     if not layers:
         raise ValueError("No layers provided.")
-
-    base = layers[0].copy()
-    for layer in layers[1:]:
-        base.alpha_composite(layer)
-    return base
+    _validate_layers(layers)
+    if len(layers) == 1:
+        return layers[0].copy()
+    if np is None:
+        return _composite_pillow(layers)
+    if layers[0].getchannel("A").getextrema()[0] == 255:
+        return _composite_opaque(layers)
+    if _composite_stack_kernel is not None:
+        return _composite_numba(layers)
+    return _composite_numpy(layers)
 
 
 def write_output(image: Image.Image, output_path: Path) -> None:
@@ -70,6 +243,7 @@ def main() -> None:
     layers = load_layers(args.layers)
     combined = combine_layers(layers)
     write_output(combined, args.output)
+    _release(combined)
 
 
 if __name__ == "__main__":
@@ -10,15 +10,29 @@ Usage example:
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import logging
 import os
-import time
 from pathlib import Path
 from typing import Iterable
 
-import requests
+import aiofiles
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
 
-from openart_client import DEFAULT_ENDPOINT, build_payload, write_metadata
+from openart_client import (
+    DEFAULT_ENDPOINT,
+    RETRY_STATUSES,
+    build_payload,
+    metadata_path,
+    retry_delay,
+)
+from openart_http import make_session
+
+_RETRIES = 5
+
+logger = logging.getLogger("pegasus.tools")
 
 
 def read_prompts(path: Path) -> list[str]:
@@ -52,10 +66,16 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--seed", type=int, default=None, help="Optional seed for deterministic outputs.")
     parser.add_argument("--timeout", type=int, default=60, help="Request timeout in seconds.")
     parser.add_argument(
-        "--delay",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of in-flight generation requests.",
+    )
+    parser.add_argument(
+        "--rate-per-minute",
         type=float,
-        default=0.0,
-        help="Seconds to wait between requests to avoid rate limits.",
+        default=60.0,
+        help="Maximum requests started per minute to avoid rate limits.",
     )
     parser.add_argument(
         "--max-prompts",
@@ -66,12 +86,12 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def perform_generation(
+async def perform_generation(
     prompt: str,
     args: argparse.Namespace,
-    session: requests.Session,
+    session: aiohttp.ClientSession,
     headers: dict[str, str],
-) -> requests.Response:
+) -> tuple[str | None, dict]:
     payload_args = argparse.Namespace(
         prompt=prompt,
         model=args.model,
@@ -79,36 +99,65 @@ def perform_generation(
         seed=args.seed,
     )
     payload = build_payload(payload_args)
-    response = session.post(args.endpoint, json=payload, headers=headers, timeout=args.timeout)
-    response.raise_for_status()
-    return response
-
-
-def process_prompts(prompts: Iterable[str], args: argparse.Namespace) -> None:
+    for attempt in range(_RETRIES):
+        async with session.post(
+            args.endpoint,
+            json=payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=args.timeout),
+        ) as response:
+            if response.status not in RETRY_STATUSES or attempt == _RETRIES - 1:
+                response.raise_for_status()
+                return response.headers.get("date"), await response.json()
+            delay = retry_delay(attempt, response.headers.get("Retry-After"))
+        await asyncio.sleep(delay)
+    raise RuntimeError("Retry loop exited without a response.")
+
+
+async def _process_one(
+    idx: int,
+    prompt: str,
+    args: argparse.Namespace,
+    session: aiohttp.ClientSession,
+    headers: dict[str, str],
+    limiter: AsyncLimiter,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    try:
+        async with limiter, semaphore:
+            date_header, payload = await perform_generation(prompt, args, session, headers)
+    except Exception as exc:  # noqa: BLE001
+        logger.info("[%d] Failed for prompt '%s': %s", idx, prompt, exc)
+        return
+
+    output_path = metadata_path(args.output_dir, date_header)
+    async with aiofiles.open(output_path, "wb") as handle:
+        await handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    logger.info("[%d] Saved response for '%s' to %s", idx, prompt, output_path)
+
+
+async def process_prompts(prompts: Iterable[str], args: argparse.Namespace) -> None:
     api_key = os.environ.get("OPENART_API_KEY")
     if not api_key:
         raise SystemExit("OPENART_API_KEY is required to call OpenArt API.")
 
-    session = requests.Session()
     headers = {"Authorization": f"Bearer {api_key}"}
+    args.output_dir.mkdir(parents=True, exist_ok=True)
 
-    prompt_list = list(prompts)
-
-    for idx, prompt in enumerate(prompt_list, start=1):
-        try:
-            response = perform_generation(prompt, args, session, headers)
-        except Exception as exc:  # noqa: BLE001
-            print(f"[{idx}] Failed for prompt '{prompt}': {exc}")
-            continue
-
-        metadata_path = write_metadata(args.output_dir, response)
-        print(f"[{idx}] Saved response for '{prompt}' to {metadata_path}")
+    limiter = AsyncLimiter(args.rate_per_minute, 60)
+    semaphore = asyncio.Semaphore(args.concurrency)
 
-        if args.delay > 0 and idx < len(prompt_list):
-            time.sleep(args.delay)
+    async with make_session() as session:
+        await asyncio.gather(
+            *(
+                _process_one(idx, prompt, args, session, headers, limiter, semaphore)
+                for idx, prompt in enumerate(prompts, start=1)
+            )
+        )
 
 
 def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = build_parser()
     args = parser.parse_args()
 
@@ -116,7 +165,7 @@ def main() -> None:
     if args.max_prompts is not None:
         prompts = prompts[: args.max_prompts]
 
-    process_prompts(prompts, args)
+    asyncio.run(process_prompts(prompts, args))
 
 
 if __name__ == "__main__":
@@ -10,16 +10,57 @@ Usage example:
 from __future__ import annotations
 
 import argparse
-import json
+import logging
 import os
+import random
+import time
 import uuid
 from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 DEFAULT_ENDPOINT = "https://openart.ai/api/v1/generate"
 
+logger = logging.getLogger("pegasus.tools")
+
+# Shared session so repeated calls reuse pooled TCP+TLS connections instead
+# of paying a fresh handshake per request. Retries stay in _post_with_retry.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Statuses worth retrying: rate limiting and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_delay(attempt: int, retry_after: str | None, base: float = 1.0) -> float:
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return base * 2**attempt + random.random() * 0.25
+
+
+def _post_with_retry(
+    session: requests.Session,
+    url: str,
+    *,
+    retries: int = 5,
+    base: float = 1.0,
+    **kwargs: Any,
+) -> requests.Response:
+    for attempt in range(retries):
+        response = session.post(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == retries - 1:
+            response.raise_for_status()
+            return response
+        time.sleep(retry_delay(attempt, response.headers.get("Retry-After"), base))
+    raise RuntimeError("Retry loop exited without a response.")
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -65,17 +106,28 @@ def build_payload(args: argparse.Namespace) -> dict[str, Any]:
     return payload
 
 
+_SAFE_NAME_TABLE = str.maketrans({" ": "_", ":": "-"})
+
+
+def metadata_path(output_dir: Path, date_header: str | None) -> Path:
+    timestamp = date_header or "response"
+    safe_name = timestamp.translate(_SAFE_NAME_TABLE)
+    unique_suffix = uuid.uuid4().hex[:8]
+    return output_dir / f"openart_{safe_name}_{unique_suffix}.json"
+
+
 def write_metadata(output_dir: Path, response: requests.Response) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = response.headers.get("date", "response")
-    safe_name = timestamp.replace(" ", "_").replace(":", "-")
-    unique_suffix = uuid.uuid4().hex[:8]
-    output_path = output_dir / f"openart_{safe_name}_{unique_suffix}.json"
-    output_path.write_text(json.dumps(response.json(), indent=2))
+    output_path = metadata_path(output_dir, response.headers.get("date"))
+    # Re-serialize from the raw bytes; orjson does both passes in C without
+    # the intermediate str that response.json() + json.dumps would build.
+    payload = orjson.loads(response.content)
+    output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     return output_path
 
 
 def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = build_parser()
     args = parser.parse_args()
 
@@ -84,15 +136,15 @@ def main() -> None:
         raise SystemExit("OPENART_API_KEY is required to call OpenArt API.")
 
     payload = build_payload(args)
-    response = requests.post(
+    response = _post_with_retry(
+        _SESSION,
         args.endpoint,
         json=payload,
         headers={"Authorization": f"Bearer {api_key}"},
         timeout=60,
     )
-    response.raise_for_status()
     output_path = write_metadata(args.output_dir, response)
-    print(f"Saved response metadata to {output_path}")
+    logger.info("Saved response metadata to %s", output_path)
 
 
 if __name__ == "__main__":
@@ -10,57 +10,56 @@ Usage example:
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import contextlib
+import logging
 import os
+from collections import deque
+from glob import has_magic, iglob
 from pathlib import Path
+from typing import AbstractSet
 from urllib.parse import urlsplit
 
-import requests
+import aiofiles
+import aiohttp
+import orjson
 
+from openart_http import make_session
 
-def looks_like_image(url: str) -> bool:
-    lowered = url.lower()
-    return lowered.startswith("http") and any(
-        lowered.split("?", 1)[0].endswith(ext) for ext in (".png", ".jpg", ".jpeg", ".webp")
-    )
+
+logger = logging.getLogger("pegasus.tools")
+
+_IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp")
 
 
 def extract_image_urls(payload: object) -> list[str]:
     urls: list[str] = []
 
-    def walk(value: object) -> None:
+    # Iterative walk avoids Python call overhead per node; the extension
+    # check runs one lower() and one C-level endswith against a tuple.
+    pending: deque[object] = deque([payload])
+    while pending:
+        value = pending.popleft()
         if isinstance(value, str):
-            if looks_like_image(value):
+            lowered = value.lower()
+            query = lowered.find("?")
+            end = query if query >= 0 else len(lowered)
+            if lowered.startswith("http") and lowered.endswith(_IMAGE_EXTS, 0, end):
                 urls.append(value)
-            return
-        if isinstance(value, dict):
-            url_value = value.get("url")
-            if isinstance(url_value, str) and looks_like_image(url_value):
-                urls.append(url_value)
-            for nested in value.values():
-                walk(nested)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
         elif isinstance(value, list):
-            for item in value:
-                walk(item)
-
-    walk(payload)
+            pending.extend(value)
 
     # Deduplicate while preserving order.
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for url in urls:
-        if url in seen:
-            continue
-        seen.add(url)
-        deduped.append(url)
-    return deduped
+    return list(dict.fromkeys(urls))
 
 
 def resolve_files(patterns: list[str]) -> list[Path]:
     files: list[Path] = []
     for pattern in patterns:
-        if any(char in pattern for char in "*?[]"):
-            files.extend(Path().glob(pattern))
+        if has_magic(pattern):
+            files.extend(map(Path, iglob(pattern, recursive=True)))
         else:
             files.append(Path(pattern))
     if not files:
@@ -68,24 +67,113 @@ def resolve_files(patterns: list[str]) -> list[Path]:
     return files
 
 
-def build_output_path(output_dir: Path, metadata_file: Path, url: str, index: int) -> Path:
+def plan_destination(
+    output_dir: Path,
+    metadata_file: Path,
+    url: str,
+    index: int,
+    taken: AbstractSet[Path] = frozenset(),
+) -> tuple[Path, Path | None]:
+    """Pick the download destination for a URL.
+
+    Returns (destination, existing) where existing is a previously
+    downloaded file that may make this download skippable; when it is set,
+    destination is the collision-renamed fallback used if the sizes differ.
+    """
     name = Path(urlsplit(url).path).name
     if not name:
         name = f"{metadata_file.stem}_{index}.png"
     destination = output_dir / name
+    if destination in taken:
+        return output_dir / f"{metadata_file.stem}_{index}_{name}", None
     if destination.exists():
-        destination = output_dir / f"{metadata_file.stem}_{index}_{name}"
-    return destination
-
-
-def download_image(url: str, destination: Path, headers: dict[str, str], timeout: int) -> None:
+        return output_dir / f"{metadata_file.stem}_{index}_{name}", destination
+    return destination, None
+
+
+async def _is_up_to_date(
+    session: aiohttp.ClientSession,
+    url: str,
+    existing: Path,
+    headers: dict[str, str],
+    timeout: int,
+) -> bool:
+    try:
+        async with session.head(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            allow_redirects=True,
+        ) as response:
+            content_length = int(response.headers.get("Content-Length", "-1"))
+    except Exception:  # noqa: BLE001 - fall back to downloading on any failure.
+        return False
+    return content_length == existing.stat().st_size
+
+
+async def download_image(
+    session: aiohttp.ClientSession,
+    url: str,
+    destination: Path,
+    headers: dict[str, str],
+    timeout: int,
+) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+    async with session.get(
+        url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+    ) as response:
         response.raise_for_status()
-        with destination.open("wb") as handle:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    handle.write(chunk)
+        async with aiofiles.open(destination, "wb") as handle:
+            # Keep one write in flight so the threadpool-backed disk flush
+            # overlaps with receiving the next network chunk. The in-flight
+            # write must be settled before the handle closes, even when the
+            # stream fails mid-body, or the abandoned task errors out later.
+            pending: asyncio.Future | None = None
+            try:
+                async for chunk in response.content.iter_chunked(1 << 20):
+                    if pending is not None:
+                        await pending
+                    pending = asyncio.ensure_future(handle.write(chunk))
+            finally:
+                if pending is not None:
+                    with contextlib.suppress(Exception):
+                        await pending
+
+
+async def _download_one(
+    session: aiohttp.ClientSession,
+    url: str,
+    destination: Path,
+    existing: Path | None,
+    metadata_file: Path,
+    headers: dict[str, str],
+    timeout: int,
+) -> None:
+    if existing is not None and await _is_up_to_date(session, url, existing, headers, timeout):
+        logger.info("Skipping %s; %s is up to date", url, existing)
+        return
+
+    try:
+        await download_image(session, url, destination, headers, timeout)
+    except Exception as exc:  # noqa: BLE001
+        logger.info("Failed to download %s from %s: %s", url, metadata_file, exc)
+        return
+
+    logger.info("Saved %s -> %s", url, destination)
+
+
+async def download_all(
+    jobs: list[tuple[str, Path, Path | None, Path]],
+    headers: dict[str, str],
+    timeout: int,
+) -> None:
+    async with make_session() as session:
+        await asyncio.gather(
+            *(
+                _download_one(session, url, destination, existing, metadata_file, headers, timeout)
+                for url, destination, existing, metadata_file in jobs
+            )
+        )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -118,6 +206,7 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = build_parser()
     args = parser.parse_args()
 
@@ -129,30 +218,30 @@ def main() -> None:
         headers["Authorization"] = f"Bearer {api_key}"
 
     metadata_files = resolve_files(args.metadata)
+    jobs: list[tuple[str, Path, Path | None, Path]] = []
+    taken: set[Path] = set()
     for metadata_path in metadata_files:
         try:
-            payload = json.loads(metadata_path.read_text(encoding="utf-8"))
+            payload = orjson.loads(metadata_path.read_bytes())
         except Exception as exc:  # noqa: BLE001
-            print(f"Failed to read metadata {metadata_path}: {exc}")
+            logger.info("Failed to read metadata %s: %s", metadata_path, exc)
             continue
 
         urls = extract_image_urls(payload)
         if not urls:
-            print(f"No image URLs found in {metadata_path}")
+            logger.info("No image URLs found in %s", metadata_path)
             continue
 
         if args.max_per_file is not None:
             urls = urls[: args.max_per_file]
 
         for index, url in enumerate(urls, start=1):
-            destination = build_output_path(args.output_dir, metadata_path, url, index)
-            try:
-                download_image(url, destination, headers, args.timeout)
-            except Exception as exc:  # noqa: BLE001
-                print(f"Failed to download {url} from {metadata_path}: {exc}")
-                continue
+            destination, existing = plan_destination(args.output_dir, metadata_path, url, index, taken)
+            taken.add(destination)
+            jobs.append((url, destination, existing, metadata_path))
 
-            print(f"Saved {url} -> {destination}")
+    if jobs:
+        asyncio.run(download_all(jobs, headers, args.timeout))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""Shared aiohttp session factory for the OpenArt tools.
+
+Both openart_batch.py and openart_download_images.py talk to the same few
+hosts, so they share one connector tuning: a generous per-host connection
+limit, a DNS cache so repeated requests skip resolution, and prompt cleanup
+of closed SSL transports.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from types import SimpleNamespace
+
+import aiohttp
+
+logger = logging.getLogger("pegasus.tools")
+
+
+def _make_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        context.started = time.monotonic()
+
+    async def on_request_end(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        elapsed = time.monotonic() - context.started
+        logger.debug(
+            "%s %s -> %d in %.3fs", params.method, params.url, params.response.status, elapsed
+        )
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+def make_session(headers: dict[str, str] | None = None) -> aiohttp.ClientSession:
+    """Build a ClientSession with the shared connector tuning.
+
+    Must be called from within a running event loop. Request timings are
+    logged at DEBUG level through the pegasus.tools logger.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=128,
+        limit_per_host=64,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        trace_configs=[_make_trace_config()],
+    )